@@ -1,14 +1,10 @@
 from __future__ import annotations
-from typing     import Any, Callable, Generator, Optional, overload
+from typing     import Any, Callable, Generator, Iterable, Optional, Sequence, overload
 from .make_repr import make_repr
 
 import json, random, itertools
 
 
-def none_filter(item) -> bool:
-    return item is not None
-
-
 class Differentials:
     def __init__(
         self,
@@ -19,96 +15,133 @@ class Differentials:
         vsd_dv : int = 0
     ) -> None:
         """Creates a differential container object with the given teams and optional default values."""
-        self.repr = make_repr(
-            Differentials.__init__,
-            (tc,),
-            (rgd_dv, "rgd_dv"),
-            (vgd_dv, "vgd_dv"),
-            (rsd_dv, "rsd_dv"),
-            (vsd_dv, "vsd_dv"),
-            fail_value = 0
-        )
+        self._tc  : TeamContainer             = tc
+        self._dvs : tuple[int, int, int, int] = (rgd_dv, vgd_dv, rsd_dv, vsd_dv)
 
-        # populate indexes
-        rgd_values  : list[int]            = []
-        rgd_indexes : dict[str | int, int] = {}
-        for i, team in enumerate(tc._teams):
-            rgd_values.append(rgd_dv)
-            rgd_indexes[team.name] = i
-            rgd_indexes[team.id]   = i
-            for alias in team.aliases:
-                rgd_indexes[alias] = i
+        # get indexes (shared with every other Differentials object of this TeamContainer)
+        rgd_indexes, rgd_teams = tc._get_diff_snapshot()
+        rgd_values : list[int] = [rgd_dv] * len(rgd_teams)
         
         # create DifferentialContainer and copy to rest
-        self.rgd : Differentials.DifferentialContainer = Differentials.DifferentialContainer(rgd_values, rgd_indexes)
+        self.rgd : Differentials.DifferentialContainer = Differentials.DifferentialContainer(rgd_values, rgd_indexes, rgd_teams)
         self.vgd : Differentials.DifferentialContainer = self.rgd.copy(vgd_dv)
         self.rsd : Differentials.DifferentialContainer = self.rgd.copy(rsd_dv)
         self.vsd : Differentials.DifferentialContainer = self.rgd.copy(vsd_dv)
 
 
     def __repr__(self) -> str:
-        return self.repr
+        rgd_dv, vgd_dv, rsd_dv, vsd_dv = self._dvs
+        return make_repr(
+            Differentials.__init__,
+            (self._tc,),
+            (rgd_dv, "rgd_dv"),
+            (vgd_dv, "vgd_dv"),
+            (rsd_dv, "rsd_dv"),
+            (vsd_dv, "vsd_dv"),
+            fail_value = 0
+        )
     
 
     def add_raw(self, identifier: team_identifier, rgd: int, vgd: int, rsd: int, vsd: int) -> None:
-        self.rgd[identifier] += rgd
-        self.vgd[identifier] += vgd
-        self.rsd[identifier] += rsd
-        self.vsd[identifier] += vsd
+        # all four containers share the same indexes, so the team only has to be resolved once
+        index = self.rgd._get_team_index(identifier)
+        self.rgd._values[index] += rgd
+        self.vgd._values[index] += vgd
+        self.rsd._values[index] += rsd
+        self.vsd._values[index] += vsd
     
 
     def combine(self, *dfs: Differentials) -> None:
         """Combines the input differentials with this object's differentials"""
+        self.combine_iter(dfs)
+    
+
+    def combine_iter(self, dfs: Iterable[Differentials]) -> None:
+        """Combines the differentials of the given iterable with this object's differentials"""
         for df in dfs:
+            # all four containers of a Differentials object share the same indexes, so the mapping only has to be built once
+            mapping: Optional[list[Optional[int]]] = self.rgd._map_indexes(df.rgd)
             for inside_diff, outside_diff in [(self.rgd, df.rgd), (self.vgd, df.vgd), (self.rsd, df.rsd), (self.vsd, df.vsd)]:
-                # find all unique indexes and their identifiers
-                unique_indexes: dict[int, list[int | str]] = {}
-                for identifier, index in outside_diff._indexes.items():
-                    if outside_diff._values[index] == 0:
-                        continue
-                    if index not in unique_indexes:
-                        unique_indexes[index] = []
-                    unique_indexes[index].append(identifier)
-                
-                # attempt to add outside diffs to inside diffs
-                for index, identifiers in unique_indexes.items():
-                    for identifier in identifiers:
-                        if identifier in inside_diff._indexes:
-                            inside_diff[identifier] += outside_diff._values[index]
-                            break
+                inside_values  : list[int] = inside_diff._values
+                outside_values : list[int] = outside_diff._values
+                # only visit the non-zero values (compress filters them without a python-level loop over every team)
+                if mapping is None:
+                    for index in itertools.compress(itertools.count(), outside_values):
+                        inside_values[index] += outside_values[index]
+                    continue
+                for index in itertools.compress(itertools.count(), outside_values):
+                    inside_index = mapping[index]
+                    if inside_index is not None:
+                        inside_values[inside_index] += outside_values[index]
     
 
     class DifferentialContainer:
-        def __init__(self, __values: list[int], __indexes: dict[str | int, int]) -> None:
-            self.repr = make_repr(
-                Differentials.DifferentialContainer.__init__,
-                (__values,),
-                (__indexes,)
-            )
-            self._values  = __values
-            self._indexes = __indexes
+        __slots__ = ("_values", "_indexes", "_teams", "_combine_cache")
+
+
+        def __init__(self, __values: list[int], __indexes: dict[str | int, int], __teams: list[Team] = ()) -> None:
+            self._values        : list[int]                                                           = __values
+            self._indexes       : dict[str | int, int]                                                = __indexes
+            self._teams         : list[Team]                                                          = __teams
+            self._combine_cache : dict[int, tuple[dict[str | int, int], Optional[list[Optional[int]]]]] = {}
         
 
         def __repr__(self) -> str:
-            return self.repr
+            return make_repr(
+                Differentials.DifferentialContainer.__init__,
+                (self._values,),
+                (self._indexes,)
+            )
 
 
         def __str__(self) -> str:
             keys_by_index = [[] for _ in self._values]
             for k, v in self._indexes.items():
                 keys_by_index[v].append(k)
+            def dump_key(key: str | int) -> str:
+                # only fall back to json.dumps when the key would actually need escaping
+                if type(key) is int:
+                    return str(key)
+                if isinstance(key, str) and key.isascii() and key.isprintable() and "\"" not in key and "\\" not in key:
+                    return "\"" + key + "\""
+                return json.dumps(key)
             lines = []
             for keys, value in zip(keys_by_index, self._values):
-                lines.append(" | ".join([json.dumps(key) for key in keys]) + f" : {value}")
+                lines.append(" | ".join([dump_key(key) for key in keys]) + f" : {value}")
             return "\n".join(lines)
 
 
-        def _get_team_index(self, __k: team_identifier) -> str:
+        def _map_indexes(self, other: Differentials.DifferentialContainer) -> Optional[list[Optional[int]]]:
+            """Maps each value index of `other` to the value index of the same team in this container (`None` if the team does not exist here); returns `None` if every index maps onto itself"""
+            if other._indexes is self._indexes:
+                return None
+
+            # indexes never change after creation, so the mapping is cached per indexes object (which is kept alive by the cache so its id can't be reused)
+            cached = self._combine_cache.get(id(other._indexes))
+            if cached is not None and cached[0] is other._indexes:
+                return cached[1]
+            mapping: Optional[list[Optional[int]]] = [None] * len(other._values)
+            for identifier, index in other._indexes.items():
+                if mapping[index] is None and identifier in self._indexes:
+                    mapping[index] = self._indexes[identifier]
+            if all(index == inside_index for index, inside_index in enumerate(mapping)):
+                mapping = None
+            self._combine_cache[id(other._indexes)] = (other._indexes, mapping)
+            return mapping
+
+
+        def _get_team_index(self, __k: team_identifier) -> int:
             if isinstance(__k, Team):
+                # the index stamped on registration is only valid if the team sits at that index in this container
+                index = __k._index
+                teams = self._teams
+                if index is not None and index < len(teams) and teams[index] is __k:
+                    return index
                 __k = __k.id
-            if __k not in self._indexes:
-                raise KeyError(f"team with name, id or alias \"{__k}\" does not exist")
-            return self._indexes[__k]
+            try:
+                return self._indexes[__k]
+            except KeyError:
+                raise KeyError(f"team with name, id or alias \"{__k}\" does not exist") from None
         
 
         def __getitem__(self, __k: team_identifier) -> int:
@@ -132,7 +165,7 @@ class Differentials:
         @overload
         def copy(self, default_value: int) -> Differentials.DifferentialContainer: ...
         def copy(self, default_value: int = None) -> Differentials.DifferentialContainer:
-            return Differentials.DifferentialContainer([default_value for _ in self._values] if default_value is not None else self._values, self._indexes)
+            return Differentials.DifferentialContainer([default_value] * len(self._values) if default_value is not None else self._values[:], self._indexes, self._teams)
         
 
         @overload
@@ -140,45 +173,55 @@ class Differentials:
         @overload
         def reset(self, default_value: int) -> None: ...
         def reset(self, default_value: int = 0) -> None:
-            self._values = [default_value for _ in self._values]
+            self._values = [default_value] * len(self._values)
 
 
 class Team:
     """Represents a team."""
+    __slots__ = ("id", "name", "aliases", "_index")
+
+
     def __init__(self, id: int, name: str, *aliases: str) -> None:
-        self.repr = make_repr(
-            Team.__init__,
-            (id,),
-            (name,),
-            *[(alias,) for alias in aliases],
-            fail_value = ()
-        )
         self.id      = id
         self.name    = name
         self.aliases = aliases
+        self._index  : Optional[int] = None # set when registered to a TeamContainer
     
 
     def __repr__(self) -> str:
-        return self.repr
+        return make_repr(
+            Team.__init__,
+            (self.id,),
+            (self.name,),
+            *[(alias,) for alias in self.aliases],
+            fail_value = ()
+        )
 
 
 class TeamContainer:
     def __init__(self) -> None:
         """Represents a group of teams."""
-        self._teams   : list[Team]         = []
-        self._indexes : dict[str|int, int] = {}
+        self._teams         : list[Team]                                      = []
+        self._indexes       : dict[str|int, int]                              = {}
+        self._diff_snapshot : Optional[tuple[dict[str|int, int], list[Team]]] = None
 
 
     def __repr__(self) -> str:
         return "TeamContainer()"
 
 
-    def _get_team_index(self, __k: team_identifier) -> str:
+    def _get_team_index(self, __k: team_identifier) -> int:
         if isinstance(__k, Team):
+            # the index stamped on registration is only valid if the team sits at that index in this container
+            index = __k._index
+            teams = self._teams
+            if index is not None and index < len(teams) and teams[index] is __k:
+                return index
             __k = __k.id
-        if __k not in self._indexes:
-            raise KeyError(f"team with name, id or alias \"{__k}\" does not exist")
-        return self._indexes[__k]
+        try:
+            return self._indexes[__k]
+        except KeyError:
+            raise KeyError(f"team with name, id or alias \"{__k}\" does not exist") from None
 
 
     def _check_for_duplicate_team(self, team: Team) -> None:
@@ -194,10 +237,19 @@ class TeamContainer:
     def _add_team(self, team: Team) -> None:
         index = len(self._teams)
         self._teams.append(team)
+        team._index = index
         self._indexes[team.name] = index
         self._indexes[team.id] = index
         for alias in team.aliases:
             self._indexes[alias] = index
+        self._diff_snapshot = None
+
+
+    def _get_diff_snapshot(self) -> tuple[dict[str|int, int], list[Team]]:
+        """Returns a snapshot of the indexes and teams that is shared by Differentials objects until another team is registered"""
+        if self._diff_snapshot is None:
+            self._diff_snapshot = (dict(self._indexes), list(self._teams))
+        return self._diff_snapshot
 
 
     def register(self, team: Team) -> None:
@@ -207,30 +259,38 @@ class TeamContainer:
 
 
     def __getitem__(self, __k: team_identifier) -> Team:
-        return self._teams[self._get_team_index(__k)]
+        # same lookup as `_get_team_index`, inlined since this is the hottest path; a team registered to this container resolves to itself
+        teams = self._teams
+        if isinstance(__k, Team):
+            index = __k._index
+            if index is not None and index < len(teams) and teams[index] is __k:
+                return __k
+            __k = __k.id
+        try:
+            return teams[self._indexes[__k]]
+        except KeyError:
+            raise KeyError(f"team with name, id or alias \"{__k}\" does not exist") from None
     
 
     def get(self, identifier: team_identifier) -> Team:
-        return self._teams[self._get_team_index(identifier)]
+        teams = self._teams
+        if isinstance(identifier, Team):
+            index = identifier._index
+            if index is not None and index < len(teams) and teams[index] is identifier:
+                return identifier
+            identifier = identifier.id
+        try:
+            return teams[self._indexes[identifier]]
+        except KeyError:
+            raise KeyError(f"team with name, id or alias \"{identifier}\" does not exist") from None
 
 
 class Series:
+    __slots__ = ("team_1", "team_2", "rscore_1", "rscore_2", "rwin_1", "rwin_2", "vscore_1", "vscore_2", "vwin_1", "vwin_2")
+
+
     def __init__(self, team_1: Team, team_2: Team, rscore_1: int, rscore_2: int, rwin_1: bool = None, rwin_2: bool = None, vscore_1: int  = None, vscore_2: int  = None, vwin_1: bool = None, vwin_2: bool = None) -> None:
         """Represents the results of one series played between two teams"""
-        self.repr     = make_repr(
-            Series.__init__,
-            (team_1,),
-            (team_2,),
-            (rscore_1,),
-            (rscore_2,),
-            (rwin_1, "rwin_1"),
-            (rwin_2, "rwin_2"),
-            (vscore_1, "vscore_1"),
-            (vscore_2, "vscore_2"),
-            (vwin_1, "vresult_1"),
-            (vwin_2, "vresult_2"),
-            fail_value = None
-        )
         self.team_1   = team_1
         self.team_2   = team_2
         self.rscore_1 = rscore_1
@@ -241,51 +301,63 @@ class Series:
         self.vscore_2 = vscore_2 or rscore_2
         self.vwin_1   = vwin_1   or self.rwin_1
         self.vwin_2   = vwin_2   or self.rwin_2
-        self.exhaused = False
     
 
     def __repr__(self) -> str:
-        return self.repr
+        # only show the optional values that differ from the ones derived from the real scores
+        return make_repr(
+            Series.__init__,
+            (self.team_1,),
+            (self.team_2,),
+            (self.rscore_1,),
+            (self.rscore_2,),
+            (None if self.vscore_1 == self.rscore_1 else self.vscore_1, "vscore_1"),
+            (None if self.vscore_2 == self.rscore_2 else self.vscore_2, "vscore_2"),
+            (None if self.vwin_1 == self.rwin_1 else self.vwin_1, "vwin_1"),
+            (None if self.vwin_2 == self.rwin_2 else self.vwin_2, "vwin_2"),
+            fail_value = None
+        )
 
 
 class SeriesContainer:
     def __init__(self, tc: TeamContainer) -> None:
         """Contains series results of multiple matchups"""
-        self.repr = make_repr(
-            SeriesContainer.__init__,
-            (tc,)
-        )
-        self._tc      : TeamContainer              = tc
-        self._indexes : dict[tuple[int, int], int] = {}
-        self._series  : list[list[Series]]         = []
+        self._tc      : TeamContainer             = tc
+        self._indexes : dict[frozenset[int], int] = {}
+        self._series  : list[list[Series]]        = []
+        self._heads   : list[int]                 = [] # number of exhausted series per matchup
     
 
     def __repr__(self) -> str:
-        return self.repr
+        return make_repr(
+            SeriesContainer.__init__,
+            (self._tc,)
+        )
 
 
     def register(self, series: Series) -> None:
         """Registers a new series to the SeriesContainer"""
-        matchup = (series.team_1.id, series.team_2.id)
+        matchup = frozenset((series.team_1.id, series.team_2.id))
         if matchup in self._indexes:
             self._series[self._indexes[matchup]].append(series)
             return
-        index = len(self._series)
+        self._indexes[matchup] = len(self._series)
         self._series.append([series])
-        self._indexes[matchup] = index
-        self._indexes[tuple(reversed(matchup))] = index
+        self._heads.append(0)
 
 
     def _get_series(self, __k1: team_identifier, __k2: team_identifier) -> Series:
         t1 = self._tc.get(__k1)
         t2 = self._tc.get(__k2)
-        matchup = (t1.id, t2.id)
-        if matchup in self._indexes:
-            series = self._series[self._indexes[matchup]]
-            for series_ in series:
-                if not series_.exhaused:
-                    series_.exhaused = True
-                    return series_
+        index = self._indexes.get(frozenset((t1.id, t2.id)))
+        if index is None:
+            return
+        # series are exhausted in order of registration, so the head is the next non-exhausted series
+        head = self._heads[index]
+        series = self._series[index]
+        if head < len(series):
+            self._heads[index] = head + 1
+            return series[head]
 
 
     def __getitem__(self, __k: tuple[team_identifier, team_identifier]) -> Series:
@@ -298,10 +370,8 @@ class SeriesContainer:
 
     def get_played_series(self) -> list[Series]:
         series_played: list[Series] = []
-        for series_list in self._series:
-            for series in series_list:
-                if series.exhaused:
-                    series_played.append(series)
+        for series_list, head in zip(self._series, self._heads):
+            series_played.extend(series_list[:head])
         return series_played
 
 
@@ -338,6 +408,87 @@ class Seeding:
             yield permutation
 
 
+    def _get_no_rematch_permutation(self, si: seed_interpreter, played: frozenset[frozenset[int]]) -> Optional[list[int]]:
+        """Finds the first permutation (in the order of `_get_rematch_permutations`) that has no rematches; only valid for interpreters that always pair the same seeding positions."""
+        # each prefix is only extended if its remaining indexes can still be paired without a rematch, so the fill never has to backtrack;
+        # that check is a memoized search over (waiting, unused) index sets, which is still exponential in the number of teams in the worst case
+        # (e.g. sparse remaining pairings), but every set is solved once and shared between all prefixes, including the no-solution case
+        num_teams : int                 = len(self.seeding_)
+
+        # map each position to the position it is paired with (`None` if it sits out)
+        partners  : list[Optional[int]] = [None] * num_teams
+        for position_1, position_2 in si(range(num_teams)):
+            partners[position_1] = position_2
+            partners[position_2] = position_1
+
+        # bitmask of the indexes each index may still be paired with
+        allowed   : list[int]           = [((1 << num_teams) - 1) ^ (1 << index) for index in range(num_teams)]
+        for matchup in played:
+            if len(matchup) != 2:
+                continue
+            index_1, index_2 = matchup
+            allowed[index_1] &= ~(1 << index_2)
+            allowed[index_2] &= ~(1 << index_1)
+
+        feasible_cache: dict[tuple[int, int, int], bool] = {}
+        def feasible(waiting: int, unused: int, sit_outs: int) -> bool:
+            """Whether every `waiting` index (placed, but its partner position is still open) can get an `unused` partner and the rest of `unused` can be paired up, with `sit_outs` of them left unpaired"""
+            key = (waiting, unused, sit_outs)
+            if key in feasible_cache:
+                return feasible_cache[key]
+            result = False
+            if waiting:
+                lowest     = waiting & -waiting
+                candidates = allowed[lowest.bit_length() - 1] & unused
+                while candidates and not result:
+                    candidate  = candidates & -candidates
+                    candidates ^= candidate
+                    result     = feasible(waiting ^ lowest, unused ^ candidate, sit_outs)
+            elif not unused:
+                result = True
+            else:
+                lowest = unused & -unused
+                rest   = unused ^ lowest
+                if sit_outs:
+                    result = feasible(0, rest, sit_outs - 1)
+                candidates = allowed[lowest.bit_length() - 1] & rest
+                while candidates and not result:
+                    candidate  = candidates & -candidates
+                    candidates ^= candidate
+                    result     = feasible(0, rest ^ candidate, sit_outs)
+            feasible_cache[key] = result
+            return result
+
+        waiting  : int = 0
+        unused   : int = (1 << num_teams) - 1
+        sit_outs : int = partners.count(None)
+        if not feasible(waiting, unused, sit_outs):
+            return
+
+        # fill positions in order with the lowest index that keeps the rest feasible (matching itertools.permutations order)
+        permutation : list[int] = []
+        for position in range(num_teams):
+            partner = partners[position]
+            for index in range(num_teams):
+                bit = 1 << index
+                if not unused & bit:
+                    continue
+                if partner is None:
+                    next_waiting, next_sit_outs = waiting, sit_outs - 1
+                elif partner > position:
+                    next_waiting, next_sit_outs = waiting | bit, sit_outs
+                else:
+                    partner_bit = 1 << permutation[partner]
+                    if not allowed[index] & partner_bit:
+                        continue
+                    next_waiting, next_sit_outs = waiting ^ partner_bit, sit_outs
+                if feasible(next_waiting, unused ^ bit, next_sit_outs):
+                    break
+            permutation.append(index)
+            waiting, unused, sit_outs = next_waiting, unused ^ bit, next_sit_outs
+        return permutation
+
+
     def sort(self, *sort_by: tuple[int, Differentials.DifferentialContainer | Callable[[], Differentials.DifferentialContainer] | Seeding | Callable[[], Seeding]]) -> Seeding:
         """Sorts in order of insert (tiebreaker); `[0]` is the coefficient, and `[1]` is the DifferentialContainer or Seeding object; returns this instance (for chaining)"""
         _sort_by: list[tuple[int, Differentials.DifferentialContainer | Seeding]] = []
@@ -345,9 +496,21 @@ class Seeding:
             _sort_by.append((coef, (criteria if isinstance(criteria, (Differentials.DifferentialContainer, Seeding)) else criteria())))
         if not all(team is not None for team in self.seeding_):
             return self
-        def sorter(team: Team) -> bool:
-            return [criteria[team] * coef if isinstance(criteria, Differentials.DifferentialContainer) else coef * criteria.seeding_.index(team) for coef, criteria in _sort_by]
-        self.seeding_.sort(key = sorter)
+        if not _sort_by:
+            return self
+
+        # build each team's sort key once, looking seeding positions up from a dict instead of scanning the seeding per team
+        columns: list[list[int]] = []
+        for coef, criteria in _sort_by:
+            if isinstance(criteria, Differentials.DifferentialContainer):
+                columns.append([criteria[team] * coef for team in self.seeding_])
+                continue
+            positions: dict[Team, int] = {}
+            for position, team in enumerate(criteria.seeding_):
+                positions.setdefault(team, position)
+            columns.append([coef * positions[team] for team in self.seeding_])
+        keys: list[tuple[int, ...]] = list(zip(*columns))
+        self.seeding_[:] = [self.seeding_[index] for index in sorted(range(len(keys)), key = keys.__getitem__)]
         return self
     
 
@@ -366,8 +529,19 @@ class Seeding:
         series_played            : list[Series]                      = sc.get_played_series()
 
         # get matchups as indexes of seeding
-        previous_matchup_indexes : list[tuple[int]]                  = [(self.seeding_.index(series.team_1), self.seeding_.index(series.team_2)) for series in series_played if series.team_1 in self.seeding_ and series.team_2 in self.seeding_]
-        previous_matchup_indexes += [tuple(reversed(matchup)) for matchup in previous_matchup_indexes]
+        positions                : dict[Team, int]                   = {}
+        for position, team in enumerate(self.seeding_):
+            positions.setdefault(team, position)
+        played                   : frozenset[frozenset[int]]         = frozenset(frozenset((positions[series.team_1], positions[series.team_2])) for series in series_played if series.team_1 in positions and series.team_2 in positions)
+
+        # the standard and reversed interpreters always pair the same positions, so rematches can be pruned while building the permutation
+        if si is SeedingInterpreter.standard or si is SeedingInterpreter.reversed:
+            permutation = self._get_no_rematch_permutation(si, played)
+            if permutation is not None:
+                self.seeding_ = [self.seeding_[index] for index in permutation]
+                return self
+            return
+
         # loop through permutations
         for rematch_permutation in rematch_permutations:
             # interpret permutation using our SeedingInterpreter
@@ -375,7 +549,7 @@ class Seeding:
             rematch_found : bool                  = False
             # loop through matchups in the interpreted permutations and make sure each was not played, otherwise break and continue to the next permutation
             for matchup in interpreted:
-                if matchup in previous_matchup_indexes:
+                if frozenset(matchup) in played:
                     rematch_found = True
                     break
             # set new seeding if all matches are not rematches
@@ -390,27 +564,25 @@ class Seeding:
 
 
 class SeedingInterpreter:
+    # interpreters also accept sequences of seeding indexes (as used by `Seeding.sort_no_rematches`); the odd team out is the last seed
     @staticmethod
-    def standard(sg: Seeding | list[Team]) -> list[tuple[Team, Team]]:
-        seeding = [] + (list(sg.seeding_) if isinstance(sg, Seeding) else list(sg))
-        if len(seeding) % 2:
-            seeding.pop()
+    def standard(sg: Seeding | Sequence[Team]) -> list[tuple[Team, Team]]:
+        seeding = sg.seeding_ if isinstance(sg, Seeding) else sg
         half = len(seeding) // 2
-        return list(zip(seeding[:half], seeding[half:]))
+        return [(seeding[i], seeding[i + half]) for i in range(half)]
     
     
     @staticmethod
-    def reversed(sg: Seeding | list[Team]) -> list[tuple[Team, Team]]:
-        seeding = [] + (list(sg.seeding_) if isinstance(sg, Seeding) else list(sg))
-        if len(seeding) % 2:
-            seeding.pop()
+    def reversed(sg: Seeding | Sequence[Team]) -> list[tuple[Team, Team]]:
+        seeding = sg.seeding_ if isinstance(sg, Seeding) else sg
         half = len(seeding) // 2
-        return list(zip(seeding[:half], list(reversed(seeding[half:]))))
+        last = 2 * half - 1
+        return [(seeding[i], seeding[last - i]) for i in range(half)]
     
     
     @staticmethod
-    def random(sg: Seeding | list[Team]) -> list[tuple[Team, Team]]:
-        seeding = [] + (list(sg.seeding_) if isinstance(sg, Seeding) else list(sg))
+    def random(sg: Seeding | Sequence[Team]) -> list[tuple[Team, Team]]:
+        seeding = list(sg.seeding_ if isinstance(sg, Seeding) else sg)
         random.shuffle(seeding)
         if len(seeding) % 2:
             seeding.pop()
@@ -426,18 +598,40 @@ seed_interpreter = Callable[[Seeding], list[tuple[Team, Team]]]
 
 class Matchup:
     def __init__(self, team_1: team_fetcher, team_2: team_fetcher) -> None:
-        self.repr = make_repr(
-            Matchup.__init__,
-            (team_1,),
-            (team_2,)
-        )
         self.team_1 = team_1
         self.team_2 = team_2
         self.result_ = self.Result()
     
 
+    # whether a team is a callable is decided whenever it is set, so `calculate` doesn't have to check it on every call
+    @property
+    def team_1(self) -> team_fetcher:
+        return self._team_1
+    
+
+    @team_1.setter
+    def team_1(self, team_1: team_fetcher) -> None:
+        self._team_1   : team_fetcher = team_1
+        self._t1_is_cb : bool         = team_1 is not None and not isinstance(team_1, Team)
+    
+
+    @property
+    def team_2(self) -> team_fetcher:
+        return self._team_2
+    
+
+    @team_2.setter
+    def team_2(self, team_2: team_fetcher) -> None:
+        self._team_2   : team_fetcher = team_2
+        self._t2_is_cb : bool         = team_2 is not None and not isinstance(team_2, Team)
+    
+
     def __repr__(self) -> str:
-        return self.repr
+        return make_repr(
+            Matchup.__init__,
+            (self.team_1,),
+            (self.team_2,)
+        )
 
 
     @overload
@@ -445,9 +639,14 @@ class Matchup:
     @overload
     def calculate(self, tc: TeamContainer, sc: SeriesContainer, df: Differentials) -> Matchup.Result: ...
     def calculate(self, tc: TeamContainer, sc: SeriesContainer, df: Differentials = None) -> Matchup.Result:
+        return self._calculate(tc, sc, df)
+
+
+    def _calculate(self, tc: TeamContainer, sc: SeriesContainer, df: Differentials = None, sdf: Differentials = None) -> Matchup.Result:
+        """Calculates the matchup; the differentials are additionally applied to `sdf` if it is defined (used by MatchSet to collect its differentials in the same pass)"""
         # get series
-        team_1 = None if self.team_1 is None else self.team_1 if isinstance(self.team_1, Team) else self.team_1()
-        team_2 = None if self.team_2 is None else self.team_2 if isinstance(self.team_2, Team) else self.team_2()
+        team_1 = self._team_1() if self._t1_is_cb else self._team_1
+        team_2 = self._team_2() if self._t2_is_cb else self._team_2
         if team_1 is None or team_2 is None:
             self.result_ = self.Result(team_1, team_2)
             return self.result_
@@ -459,33 +658,35 @@ class Matchup:
         # create idf
         idf = Differentials(sc._tc)
 
-        # get data from series
-        t1_data = (series.rscore_1, series.vscore_1, series.rwin_1, series.vwin_1)
-        t2_data = (series.rscore_2, series.vscore_2, series.rwin_2, series.vwin_2)
-
-        # assign data to variables and ensure data team matches self team
-        t1_rs, t1_vs, t1_rw, t1_vw, t2_rs, t2_vs, t2_rw, t2_vw = (*t1_data, *t2_data) if series.team_1 == team_1 else (*t2_data, *t1_data)
+        # get data from series, ensuring data team matches self team
+        if series.team_1 is team_1:
+            t1_rs, t1_vs, t1_rw, t1_vw = series.rscore_1, series.vscore_1, series.rwin_1, series.vwin_1
+            t2_rs, t2_vs, t2_rw, t2_vw = series.rscore_2, series.vscore_2, series.rwin_2, series.vwin_2
+        else:
+            t1_rs, t1_vs, t1_rw, t1_vw = series.rscore_2, series.vscore_2, series.rwin_2, series.vwin_2
+            t2_rs, t2_vs, t2_rw, t2_vw = series.rscore_1, series.vscore_1, series.rwin_1, series.vwin_1
         
-        # apply differentials if df is defined
-        t1_diffs = (
-            t1_rs - t2_rs,
-            t1_vs - t2_vs,
-            1 if t1_rw else -1,
-            1 if t1_vw else -1
-        )
-        t2_diffs = (
-            t2_rs - t1_rs,
-            t2_vs - t1_vs,
-            1 if t2_rw else -1,
-            1 if t2_vw else -1
-        )
-        idf.add_raw(team_1, *t1_diffs)
-        idf.add_raw(team_2, *t2_diffs)
+        # apply differentials (to df and sdf only if they are defined)
+        rgd = t1_rs - t2_rs
+        vgd = t1_vs - t2_vs
+        t1_rsd = 1 if t1_rw else -1
+        t1_vsd = 1 if t1_vw else -1
+        t2_rsd = 1 if t2_rw else -1
+        t2_vsd = 1 if t2_vw else -1
+        idf.add_raw(team_1, rgd, vgd, t1_rsd, t1_vsd)
+        idf.add_raw(team_2, -rgd, -vgd, t2_rsd, t2_vsd)
         if df is not None:
-            df.add_raw(team_1, *t1_diffs)
-            df.add_raw(team_2, *t2_diffs)
+            df.add_raw(team_1, rgd, vgd, t1_rsd, t1_vsd)
+            df.add_raw(team_2, -rgd, -vgd, t2_rsd, t2_vsd)
+        if sdf is not None:
+            sdf.add_raw(team_1, rgd, vgd, t1_rsd, t1_vsd)
+            sdf.add_raw(team_2, -rgd, -vgd, t2_rsd, t2_vsd)
         
         # return full result
+        if t1_rs > t2_rs:
+            winner, loser, winner_rscore, loser_rscore = team_1, team_2, t1_rs, t2_rs
+        else:
+            winner, loser, winner_rscore, loser_rscore = team_2, team_1, t2_rs, t1_rs
         self.result_ = self.Result(
             team_1,
             team_2,
@@ -499,7 +700,10 @@ class Matchup:
             t2_vw,
             t1_rs > t2_rs,
             t1_rs < t2_rs,
-            *(team_1, team_2, t1_rs, t2_rs) if t1_rs > t2_rs else (team_2, team_1, t2_rs, t1_rs),
+            winner,
+            loser,
+            winner_rscore,
+            loser_rscore,
             df,
             idf
         )
@@ -526,6 +730,9 @@ class Matchup:
 
 
     class Result:
+        __slots__ = ("team_1", "team_2", "rscore_1", "rscore_2", "vscore_1", "vscore_2", "rwin_1", "rwin_2", "vwin_1", "vwin_2", "is_winner_1", "is_winner_2", "winner", "loser", "winner_rscore", "loser_rscore", "df", "idf")
+
+
         @overload
         def __init__(self) -> None: ...
         @overload
@@ -535,28 +742,6 @@ class Matchup:
         @overload
         def __init__(self, team_1: Team, team_2: Team, rscore_1: int, rscore_2: int, vscore_1: int, vscore_2: int, rwin_1: bool, rwin_2: bool, vwin_1: bool, vwin_2: bool, is_winner_1: bool, is_winner_2: bool, winner: Team, loser: Team, winner_rscore: int, loser_rscore: int, df: Differentials, idf: Differentials) -> None: ...
         def __init__(self, team_1: Team = None, team_2: Team = None, rscore_1: int = None, rscore_2: int = None, vscore_1: int = None, vscore_2: int = None, rwin_1: bool = None, rwin_2: bool = None, vwin_1: bool = None, vwin_2: bool = None, is_winner_1: bool = None, is_winner_2: bool = None, winner: Team = None, loser: Team = None, winner_rscore: int = None, loser_rscore: int = None, df: Differentials = None, idf: Differentials = None) -> None:
-            self.repr = make_repr(
-                Matchup.Result.__init__,
-                (team_1, "team_1"),
-                (team_2, "team_2"),
-                (rscore_1, "rscore_1"),
-                (rscore_2, "rscore_2"),
-                (vscore_1, "vscore_1"),
-                (vscore_2, "vscore_2"),
-                (rwin_1, "rwin_1"),
-                (rwin_2, "rwin_2"),
-                (vwin_1, "vwin_1"),
-                (vwin_2, "vwin_2"),
-                (is_winner_1, "is_winner_1"),
-                (is_winner_2, "is_winner_2"),
-                (winner, "winner"),
-                (loser, "loser"),
-                (winner_rscore, "winner_rscore"),
-                (loser_rscore, "loser_rscore"),
-                (df, "df"),
-                (idf, "idf"),
-                fail_value = None
-            )
             self.team_1        : Team          = team_1
             self.team_2        : Team          = team_2
             self.rscore_1      : int           = rscore_1 
@@ -578,7 +763,28 @@ class Matchup:
 
 
         def __repr__(self) -> str:
-            return self.repr
+            return make_repr(
+                Matchup.Result.__init__,
+                (self.team_1, "team_1"),
+                (self.team_2, "team_2"),
+                (self.rscore_1, "rscore_1"),
+                (self.rscore_2, "rscore_2"),
+                (self.vscore_1, "vscore_1"),
+                (self.vscore_2, "vscore_2"),
+                (self.rwin_1, "rwin_1"),
+                (self.rwin_2, "rwin_2"),
+                (self.vwin_1, "vwin_1"),
+                (self.vwin_2, "vwin_2"),
+                (self.is_winner_1, "is_winner_1"),
+                (self.is_winner_2, "is_winner_2"),
+                (self.winner, "winner"),
+                (self.loser, "loser"),
+                (self.winner_rscore, "winner_rscore"),
+                (self.loser_rscore, "loser_rscore"),
+                (self.df, "df"),
+                (self.idf, "idf"),
+                fail_value = None
+            )
 
 
 class MatchSet:
@@ -599,15 +805,12 @@ class MatchSet:
         team_matchups   : list[tuple[Team, Team]] = self._si(seeding)
         matchups        : list[Matchup]           = [Matchup(team_1, team_2) for team_1, team_2 in team_matchups]
 
-        # calculate each result
+        # calculate each result, applying its differentials to the idf as we go rather than combining every matchup's idf afterwards
+        idf             : Differentials        = Differentials(tc)
         matchup_results : list[Matchup.Result] = []
         for matchup in matchups:
-            result = matchup.calculate(tc, sc, df)
+            result = matchup._calculate(tc, sc, df, idf)
             matchup_results.append(result)
-
-        # create idf
-        idf: Differentials = Differentials(tc)
-        idf.combine(*list(filter(none_filter, [result.idf for result in matchup_results])))
         
         # get seeding objects from winning and losing teams
         winning_teams   : list[Optional[Team]] = [result.winner for result in matchup_results]
@@ -629,20 +832,14 @@ class MatchSet:
 
 
     class Result:
+        __slots__ = ("results", "winners", "losers", "idf", "df")
+
+
         @overload
         def __init__(self, results: list[Matchup.Result], winners: Seeding, losers: Seeding, idf: Differentials) -> None: ...
         @overload
         def __init__(self, results: list[Matchup.Result], winners: Seeding, losers: Seeding, idf: Differentials, df: Differentials) -> None: ...
         def __init__(self, results: list[Matchup.Result], winners: Seeding, losers: Seeding, idf: Differentials, df: Differentials = None) -> None:
-            self.repr = make_repr(
-                MatchSet.Result.__init__,
-                (results,),
-                (winners,),
-                (losers,),
-                (idf,),
-                (df, "df"),
-                fail_value = None
-            )
             self.results : list[Matchup.Result] = results
             self.winners : Seeding              = winners
             self.losers  : Seeding              = losers
@@ -651,7 +848,15 @@ class MatchSet:
         
 
         def __repr__(self) -> str:
-            return self.repr
+            return make_repr(
+                MatchSet.Result.__init__,
+                (self.results,),
+                (self.winners,),
+                (self.losers,),
+                (self.idf,),
+                (self.df, "df"),
+                fail_value = None
+            )
             
 
 class BracketModel:
@@ -7,18 +7,19 @@ def make_repr(func: Callable, *items: list[tuple | tuple[Any, str]], fail_value:
     ```
     class ExampleClass:
         def __init__(self, a, b, *, c = None) -> None:
-            self._repr = make_repr(
-                ExampleClass.__init__,
-                (a,),
-                (b,),
-                (c, "c"), # Any keyword arguments should have the name of the keyword argument as the second value in the tuple
-                fail_value = None
-            )
-            ...
+            self.a = a
+            self.b = b
+            self.c = c
         
 
         def __repr__(self) -> str:
-            return self._repr
+            return make_repr(
+                ExampleClass.__init__,
+                (self.a,),
+                (self.b,),
+                (self.c, "c"), # Any keyword arguments should have the name of the keyword argument as the second value in the tuple
+                fail_value = None
+            )
     
 
     inst = ExampleClass("value_for_a", "value_for_b")
@@ -32,11 +33,14 @@ def make_repr(func: Callable, *items: list[tuple | tuple[Any, str]], fail_value:
 
     ```
     """
-    def dump_if_str(item) -> str:
-        return f"\"{str(item)}\"" if isinstance(item, str) else str(item)
-    posargs : list[tuple[Any]]      = list(filter(lambda x: len(x) == 1, items))
-    kwargs  : list[tuple[Any, str]] = list(filter(lambda x: len(x) == 2 and x[0] != fail_value, items))
-    args    : list[str]             = []
-    args.extend([dump_if_str(posarg[0]) for posarg in posargs])
-    args.extend([kwarg[1] + "=" + dump_if_str(kwarg[0]) for kwarg in kwargs])
+    args   : list[str] = []
+    kwargs : list[str] = []
+    for item in items:
+        if len(item) == 1:
+            value = item[0]
+            args.append(f"\"{value}\"" if isinstance(value, str) else str(value))
+        elif len(item) == 2 and item[0] != fail_value:
+            value = item[0]
+            kwargs.append(item[1] + "=" + (f"\"{value}\"" if isinstance(value, str) else str(value)))
+    args.extend(kwargs)
     return func.__qualname__ + "(" + ", ".join(args) + ")"
\ No newline at end of file